@@ -1,9 +1,177 @@
-import os
 import sys
+import json
+import hashlib
+import io
+import threading
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
+CHUNK_SIZE = 1024 * 1024          # 单次读写块大小
+RANGE_SIZE = 8 * 1024 * 1024      # 分段下载时每段的大小
+DOWNLOAD_WORKERS = 4              # 分段下载的并行连接数
+TIMEOUT = (10, 60)                # (连接超时, 读取超时) 秒
+MANIFEST_NAME = 'ffmpeg_manifest.json'  # 记录已解压文件大小和 SHA-256 的清单
+
+# 所有请求复用同一个会话，分段下载的各连接共享连接池与 TLS 会话
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=DOWNLOAD_WORKERS,
+    pool_maxsize=DOWNLOAD_WORKERS,
+    # 连接失败或服务器临时错误时按指数退避自动重试，不必重新执行整个流程
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=('GET', 'HEAD'),
+    ),
+))
+# zip 本身已经压缩，不再协商传输压缩，也避免分段偏移与解码后的长度不一致
+_SESSION.headers['Accept-Encoding'] = 'identity'
+
+class _RangeNotSupported(Exception):
+    """服务器对 Range 请求返回了完整内容（200）而不是分段内容（206）"""
+
+def _download_range(url, start, end, buf, lock):
+    """下载 [start, end] 字节区间并写入缓冲区的对应位置"""
+    response = _SESSION.get(url, headers={'Range': f'bytes={start}-{end}'}, stream=True, timeout=TIMEOUT)
+    response.raise_for_status()
+    if response.status_code != 206:
+        response.close()
+        raise _RangeNotSupported(f"服务器未返回分段内容: {response.status_code}")
+
+    offset = start
+    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+        with lock:
+            buf.seek(offset)
+            buf.write(chunk)
+        offset += len(chunk)
+
+    if offset != end + 1:
+        raise RuntimeError(f"分段下载不完整: bytes={start}-{end}")
+
+def _download(url, buf):
+    """下载文件到缓冲区，服务器支持 Range 请求时分段并行下载"""
+    head = _SESSION.head(url, allow_redirects=True, timeout=TIMEOUT)
+    head.raise_for_status()
+    total_size = int(head.headers.get('content-length', 0))
+
+    use_ranges = head.headers.get('accept-ranges') == 'bytes' and total_size > RANGE_SIZE
+    if use_ranges:
+        # 预先扩展缓冲区到完整大小，各分段直接写入自己的偏移位置
+        buf.seek(total_size - 1)
+        buf.write(b'\0')
+
+        lock = threading.Lock()
+        ranges = [
+            (start, min(start + RANGE_SIZE, total_size) - 1)
+            for start in range(0, total_size, RANGE_SIZE)
+        ]
+        # 使用重定向后的地址，避免每个分段都重复跳转
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = [executor.submit(_download_range, head.url, start, end, buf, lock) for start, end in ranges]
+            try:
+                for future in futures:
+                    future.result()
+            except _RangeNotSupported as e:
+                # CDN 或代理可能声明支持分段却返回完整内容，此时改用单连接下载
+                print(f"{str(e)}，改用单连接下载")
+                for future in futures:
+                    future.cancel()
+                use_ranges = False
+        if not use_ranges:
+            # 丢弃已写入的分段
+            buf.seek(0)
+            buf.truncate()
+
+    if not use_ranges:
+        # 服务器不支持分段下载，使用单连接下载
+        response = _SESSION.get(url, stream=True, timeout=TIMEOUT)
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            buf.write(chunk)
+
+    buf.seek(0)
+
+def _file_sha256(path):
+    """按块计算文件的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _is_up_to_date(bin_dir):
+    """bin 目录中的 FFmpeg 文件与清单记录的大小和 SHA-256 一致时返回 True"""
+    try:
+        manifest = json.loads((bin_dir / MANIFEST_NAME).read_text(encoding='utf-8'))
+        for name in ('ffmpeg.exe', 'ffprobe.exe'):
+            path = bin_dir / name
+            # 先比较大小，不一致时无需计算哈希
+            if path.stat().st_size != manifest[name]['size']:
+                return False
+            if _file_sha256(path) != manifest[name]['sha256']:
+                return False
+        return True
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+def _extract_one(zip_ref, info, dst):
+    """将压缩包中的单个文件直接写入目标路径，返回 (文件大小, SHA-256)"""
+    # ZipExtFile 读到末尾时会自动比对中央目录中的 CRC-32，不一致时抛出 BadZipFile
+    digest = hashlib.sha256()
+    with zip_ref.open(info) as src, open(dst, 'wb') as out:
+        # 按中央目录记录的大小预先分配文件空间，避免写入过程中反复扩展文件
+        out.truncate(info.file_size)
+        out.seek(0)
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+            out.write(chunk)
+        written = out.tell()
+    if written != info.file_size:
+        raise zipfile.BadZipFile(f"{info.filename} 大小不符: {written} != {info.file_size}")
+    return written, digest.hexdigest()
+
+def _download_and_extract(url, bin_dir):
+    """下载压缩包并将 ffmpeg.exe 和 ffprobe.exe 解压到 bin 目录"""
+    # 压缩包缓存在内存中，不再写入bin目录后重新读取
+    # 不使用 SpooledTemporaryFile：Python 3.11 之前它没有 seekable()，ZipFile.open() 会报错
+    with io.BytesIO() as buf:
+        # 下载FFmpeg
+        _download(url, buf)
+
+        print("下载完成，正在解压...")
+
+        # 解压文件：只遍历一次中央目录，按文件名找到目标后直接写入bin目录根目录
+        targets = {'ffmpeg.exe', 'ffprobe.exe'}
+        with zipfile.ZipFile(buf, 'r') as zip_ref:
+            members = []
+            for info in zip_ref.infolist():
+                name = info.filename.rsplit('/', 1)[-1]
+                if name not in targets:
+                    continue
+                members.append((info, bin_dir / name))
+                targets.discard(name)
+                if not targets:
+                    break
+            if targets:
+                raise FileNotFoundError(f"压缩包中缺少: {', '.join(sorted(targets))}")
+
+            # 两个文件并行解压（ZipFile 读取时内部加锁，解压缩过程会释放GIL）
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(_extract_one, zip_ref, info, dst) for info, dst in members]
+                manifest = {}
+                for (_, dst), future in zip(members, futures):
+                    size, sha256 = future.result()
+                    manifest[dst.name] = {'size': size, 'sha256': sha256}
+
+    # 记录清单，下次运行时文件未变化则跳过下载
+    (bin_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+
 def download_ffmpeg():
     """
     下载并配置FFmpeg
@@ -11,44 +179,36 @@ def download_ffmpeg():
     # FFmpeg下载地址
     ffmpeg_url = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip"
     bin_dir = Path("bin")
-    zip_path = bin_dir / "ffmpeg.zip"
 
     # 创建bin目录
     bin_dir.mkdir(exist_ok=True)
 
+    # 已有文件与清单一致时无需重新下载
+    if _is_up_to_date(bin_dir):
+        print("FFmpeg已是最新，跳过下载")
+        return
+
     print("正在下载FFmpeg...")
     try:
-        # 下载FFmpeg
-        response = requests.get(ffmpeg_url, stream=True)
-        response.raise_for_status()
-        
-        # 保存zip文件
-        with open(zip_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-
-        print("下载完成，正在解压...")
-        
-        # 解压文件
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            for file in zip_ref.namelist():
-                if file.endswith(('ffmpeg.exe', 'ffprobe.exe')):
-                    zip_ref.extract(file, bin_dir)
-                    # 移动文件到bin目录根目录
-                    src = bin_dir / file
-                    dst = bin_dir / Path(file).name
-                    if src != dst:
-                        os.rename(src, dst)
+        # 下载内容损坏（CRC 或大小校验失败、解压数据流出错或被截断）时重新下载一次
+        for attempt in range(2):
+            try:
+                _download_and_extract(ffmpeg_url, bin_dir)
+                break
+            except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+                if attempt:
+                    raise
+                print(f"压缩包校验失败，重新下载: {str(e)}")
 
         print("FFmpeg配置完成！")
 
-    except Exception as e:
+    except requests.RequestException as e:
+        # 会话已自动重试，到这里说明重试次数已用完或遇到不可重试的错误
+        print(f"下载失败：{str(e)}")
+        sys.exit(1)
+    except (zipfile.BadZipFile, zlib.error, EOFError, OSError, RuntimeError) as e:
         print(f"错误：{str(e)}")
         sys.exit(1)
-    finally:
-        # 清理zip文件
-        if zip_path.exists():
-            zip_path.unlink()
 
 if __name__ == "__main__":
     download_ffmpeg() 
\ No newline at end of file
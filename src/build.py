@@ -22,9 +22,10 @@ def build_exe():
         'src/main.py',                          # 主程序文件
         '--name=losslessClip无损剪辑v1.1',      # 生成的 exe 文件名
         '--windowed',                           # 不显示命令行窗口
-        '--onefile',                            # 打包成单个文件
+        '--onedir',                             # 打包成目录，避免每次启动解压到临时目录
         '--clean',                              # 清理临时文件
         '--noconfirm',                          # 覆盖现有文件
+        '--noupx',                              # 不使用 UPX 压缩，避免启动时解压 DLL
         f'--add-data=bin/ffmpeg.exe;bin',      # 添加 FFmpeg
         f'--add-data=bin/ffprobe.exe;bin',     # 添加 FFprobe
         f'--add-data=assets/teamG.ico;assets', # 添加图标文件到资源
@@ -1,61 +1,66 @@
-import sys
 import os
+import sys
+import atexit
+import queue
 import logging
-import ctypes
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QIcon
-from main_window import MainWindow
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
 
-# Windows任务栏图标设置
-if sys.platform == 'win32':
-    # 设置程序ID
-    myappid = 'teamg.videocutter.1.1'
-    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-    
-    # 设置任务栏图标
-    if hasattr(sys, '_MEIPASS'):
-        # PyInstaller 打包后的路径
-        icon_path = os.path.join(sys._MEIPASS, 'assets', 'teamG.ico')
-    else:
-        # 开发环境路径
-        icon_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'teamG.ico')
+# 图标路径（PyInstaller 打包后位于 _MEIPASS，开发环境位于项目根目录），只计算一次
+ICON_PATH = Path(getattr(sys, '_MEIPASS', Path(__file__).resolve().parent.parent)) / 'assets' / 'teamG.ico'
+
+# 日志写入交给后台 QueueListener 线程，记录日志的线程只需入队，不会阻塞在磁盘写入上
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('debug.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('debug.log'),
-        logging.StreamHandler()
-    ]
-)
+_root_logger = logging.getLogger()
+# 打包发布版本只记录 INFO 及以上级别
+_root_logger.setLevel(logging.INFO if getattr(sys, 'frozen', False) else logging.DEBUG)
+_root_logger.addHandler(QueueHandler(_log_queue))
 
 print("程序开始运行...")
 
 def main():
     """程序入口函数"""
+    # 打包后插件目录固定，直接指定平台插件和插件路径，省去 Qt 启动时的插件搜索
+    if sys.platform == 'win32' and hasattr(sys, '_MEIPASS'):
+        plugin_path = Path(sys._MEIPASS) / 'PyQt5' / 'Qt5' / 'plugins'
+        if plugin_path.is_dir():
+            os.environ.setdefault('QT_QPA_PLATFORM', 'windows')
+            os.environ.setdefault('QT_PLUGIN_PATH', str(plugin_path))
+
+    # Windows任务栏图标设置：设置程序ID，需在 Qt 创建窗口之前调用
+    if sys.platform == 'win32':
+        import ctypes
+        myappid = 'teamg.videocutter.1.1'
+        shell32 = ctypes.WinDLL('shell32', use_last_error=True)
+        shell32.SetCurrentProcessExplicitAppUserModelID(ctypes.c_wchar_p(myappid))
+
+    # Qt 相关模块在此处才导入，避免模块导入阶段就加载 Qt 动态库
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QIcon
+    from main_window import MainWindow
+
     print("进入 main 函数...")
     app = QApplication(sys.argv)
     
     # 设置应用程序图标
-    if hasattr(sys, '_MEIPASS'):
-        # PyInstaller 打包后的路径
-        icon_path = os.path.join(sys._MEIPASS, 'assets', 'teamG.ico')
+    if ICON_PATH.is_file():
+        app.setWindowIcon(QIcon(str(ICON_PATH)))
+        logging.debug(f"图标路径存在: {ICON_PATH}")
     else:
-        # 开发环境路径
-        icon_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'teamG.ico')
+        logging.debug(f"图标路径不存在: {ICON_PATH}")
     
-    if os.path.exists(icon_path):
-        app_icon = QIcon(icon_path)
-        app.setWindowIcon(app_icon)
-        print(f"图标路径存在: {icon_path}")
-    else:
-        print(f"图标路径不存在: {icon_path}")
-    
-    # 确保图标设置成功
-    if not app.windowIcon().isNull():
-        print("图标设置成功")
-    else:
-        print("图标设置失败")
+    # 仅在调试日志级别下校验图标是否设置成功
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("图标设置成功" if not app.windowIcon().isNull() else "图标设置失败")
     
     window = MainWindow()
     window.show()
@@ -1,9 +1,12 @@
 import sys
 import os
+import time
+import threading
 import cv2
 import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import timedelta
 from typing import Optional, Tuple
 
 from PyQt5.QtWidgets import (
@@ -12,7 +15,7 @@ from PyQt5.QtWidgets import (
     QSlider, QLineEdit
 )
 from PyQt5.QtCore import Qt, QTimer, QPoint, QThread, pyqtSignal, QEvent
-from PyQt5.QtGui import QImage, QPixmap, QDragEnterEvent, QDropEvent, QKeyEvent, QIcon
+from PyQt5.QtGui import QImage, QPainter, QDragEnterEvent, QDropEvent, QKeyEvent, QIcon
 
 from video_processor import VideoProcessor
 
@@ -23,52 +26,169 @@ class CustomSlider(QSlider):
         # 忽略所有键盘事件
         event.ignore()
 
-class VideoLoadThread(QThread):
-    """视频加载线程"""
-    finished = pyqtSignal(bool)  # 加载完成信号
-    progress = pyqtSignal(str)   # 进度信号
+def resize_to_preview(frame: np.ndarray, width: int, height: int,
+                      dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """将帧缩小到预览尺寸写入dst（为None时新分配），尺寸已一致时原样返回"""
+    src_height, src_width = frame.shape[:2]
+    if (src_height, src_width) == (height, width):
+        return frame
+    if dst is None:
+        dst = np.empty((height, width, 3), dtype=np.uint8)
+        
+    step = src_width // width
+    if step * width == src_width and step * height == src_height:
+        # 整数倍缩小时隔行隔列取样，结果与INTER_NEAREST相同，只需一次拷贝
+        np.copyto(dst, frame[::step, ::step])
+    else:
+        # 非整数倍时用区域插值（OpenCV有SIMD优化），缩小比例大时锯齿比INTER_NEAREST少
+        cv2.resize(frame, (width, height), dst, interpolation=cv2.INTER_AREA)
+    return dst
 
-    def __init__(self, video_processor, file_path):
-        super().__init__()
-        self.video_processor = video_processor
-        self.file_path = file_path
-
-    def run(self):
-        try:
-            self.progress.emit("正在加载视频信息...")
-            success = self.video_processor.load_video(self.file_path)
-            self.finished.emit(success)
-        except Exception as e:
-            print(f"加载视频线程错误: {str(e)}")
-            self.finished.emit(False)
-
-class VideoCutThread(QThread):
-    """视频剪辑线程"""
-    finished = pyqtSignal(bool, str)  # (成功与否, 输出路径)
-    progress = pyqtSignal(str)        # 进度信息
+class VideoLabel(QLabel):
+    """视频显示区域，直接把QImage绘制到控件上，省去QPixmap拷贝"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._image: Optional[QImage] = None
+        self._image_data: Optional[np.ndarray] = None  # 保持QImage底层数据的引用
+        
+    def set_image(self, image: QImage, data: np.ndarray):
+        """设置要显示的帧并触发重绘"""
+        self._image = image
+        self._image_data = data
+        self.update()
+        
+    def paintEvent(self, event):
+        # 先绘制样式表背景，再把帧拉伸绘制到内容区域
+        super().paintEvent(event)
+        if self._image is not None:
+            painter = QPainter(self)
+            painter.drawImage(self.contentsRect(), self._image)
+            painter.end()
 
-    def __init__(self, video_processor, start_time, end_time, output_path):
+class FrameDecodeThread(QThread):
+    """后台解码线程
+    
+    播放时在后台连续解码并缩小到预览尺寸，把 (帧位置, 帧) 放入有界队列，
+    界面线程定时取出显示，解码和缩放耗时不再阻塞界面。界面线程访问 VideoCapture 前必须持有 cap_lock，
+    跳转后更新 position 并调用 flush() 丢弃旧位置的帧。
+    """
+    decode_stopped = pyqtSignal()  # 视频无法解码、后台解码自行停止时发出
+    
+    def __init__(self, max_frames: int = 2):
         super().__init__()
-        self.video_processor = video_processor
-        self.start_time = start_time
-        self.end_time = end_time
-        self.output_path = output_path
+        self.cap_lock = threading.Lock()  # 保护 VideoCapture，解码和界面跳转互斥
+        self._cond = threading.Condition()  # 保护帧队列和播放状态
+        self._frames = deque()
+        self._max_frames = max_frames
+        self._cap: Optional[cv2.VideoCapture] = None
+        self._preview_size: Optional[Tuple[int, int]] = None  # (宽, 高)
+        self._decode_buffer: Optional[np.ndarray] = None  # 复用的全尺寸解码缓存
+        self.position = 0  # 下一帧的序号（与CAP_PROP_POS_FRAMES含义相同），持有cap_lock时读写
+        self._active = False
+        self._stopped = False
+        
+    def set_capture(self, cap: Optional[cv2.VideoCapture],
+                    preview_size: Optional[Tuple[int, int]] = None):
+        """切换要解码的视频，preview_size 为 (宽, 高)"""
+        with self.cap_lock:
+            self.position = 0
+            self._preview_size = preview_size
+            self._decode_buffer = None
+            with self._cond:
+                self._cap = cap
+                self._frames.clear()
+                self._cond.notify_all()
+                
+    def set_active(self, active: bool):
+        """开始/暂停后台解码"""
+        with self._cond:
+            self._active = active
+            self._cond.notify_all()
+            
+    def flush(self):
+        """丢弃已解码但未显示的帧"""
+        with self._cond:
+            self._frames.clear()
+            self._cond.notify_all()
+            
+    def take_frame(self) -> Optional[Tuple[int, np.ndarray]]:
+        """取出最早解码的一帧，队列为空时返回None"""
+        with self._cond:
+            if not self._frames:
+                return None
+            item = self._frames.popleft()
+            self._cond.notify_all()
+            return item
+            
+    def stop(self):
+        """停止解码线程并等待退出"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self.wait()
         
     def run(self):
-        try:
-            self.progress.emit("正在导出视频...")
-            success = self.video_processor.cut_video(
-                self.start_time,
-                self.end_time,
-                self.output_path
-            )
-            self.finished.emit(success, self.output_path)
-        except Exception as e:
-            print(f"视频剪辑线程错误: {str(e)}")
-            self.finished.emit(False, self.output_path)
+        while True:
+            with self._cond:
+                # 暂停或队列已满时等待，避免无谓解码
+                while not self._stopped and (
+                    not self._active or self._cap is None or len(self._frames) >= self._max_frames
+                ):
+                    self._cond.wait()
+                if self._stopped:
+                    break
+                    
+            with self.cap_lock:
+                try:
+                    decoded = self._decode_one()
+                except Exception as e:
+                    print(f"后台解码时发生错误: {str(e)}")
+                    decoded = False
+                    
+            if not decoded:
+                self.msleep(10)  # 读取失败时稍作等待，避免空转
+                
+    def _decode_one(self) -> bool:
+        """解码一帧放入队列（调用方需持有 cap_lock）"""
+        cap = self._cap
+        if cap is None:
+            return False
+        if cap.grab():
+            self.position += 1
+            ret, frame = cap.retrieve(self._decode_buffer)
+            if ret:
+                small = frame
+                if self._preview_size is not None:
+                    small = resize_to_preview(frame, *self._preview_size)
+                if small is frame:
+                    # 解码帧直接交给界面线程，下次重新分配解码缓存
+                    self._decode_buffer = None
+                else:
+                    self._decode_buffer = frame
+                frame = small
+                with self._cond:
+                    # 等待期间可能已经切换视频，此时丢弃这一帧
+                    if self._cap is cap:
+                        self._frames.append((self.position, frame))
+                return True
+        if not cap.isOpened():
+            # 读取器已关闭（FFmpeg 子进程无法输出帧），停止后台解码，不再反复重启
+            print("无法读取视频帧，停止后台解码")
+            with self._cond:
+                self._active = False
+            self.decode_stopped.emit()
+            return False
+        # 播放到结尾时回到开头
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self.position = 0
+        return False
 
 class MainWindow(QMainWindow):
     """主窗口类"""
+    # 后台任务通过信号把结果送回界面线程
+    video_loaded = pyqtSignal(bool)     # 加载完成信号
+    video_cut = pyqtSignal(bool, str)   # (成功与否, 输出路径)
+    status_changed = pyqtSignal(str)    # 进度信息
     
     def __init__(self):
         super().__init__()
@@ -78,21 +198,35 @@ class MainWindow(QMainWindow):
         self.is_playing = False
         self.start_time = 0.0
         self.end_time = 0.0
-        self.load_thread = None
+        self._executor = ThreadPoolExecutor(max_workers=2)  # 执行加载、剪辑等后台任务
         self.preview_width = 480   # 降至270p用于处理
         self.preview_height = 270
         self.display_width = 854   # 保持480p的显示大小
         self.display_height = 480
         self.slider_pressed = False
-        
-        # 初始化帧缓存和pixmap缓存
+        self.max_grab_frames = 30  # 向后跳转不超过该帧数时逐帧grab，不重新定位关键帧
+        self._current_pos = 0  # 当前显示帧的位置（与CAP_PROP_POS_FRAMES含义相同）
+        self._fps = 0.0  # 加载视频时缓存，避免每帧调用 cap.get()
+        self._total_frames = 0
+        self._last_time_display = None  # 上次显示的 (毫秒, 进度条值)，未变化时跳过更新
+        self._exported_marks = None  # 正在导出的 (起点, 终点)，导出完成时判断标记是否已改动
+        
+        # 初始化帧缓存
         self._frame_buffer = None
-        self._cached_pixmap = None
+        self._gray_buffer = None
+        self._frame_image = None  # 包装帧缓存的QImage，缓存原地更新，无需每帧重新构造
+        self._gray_image = None
+        self._grayscale_preview = False  # 4K视频拖动进度条时使用灰度预览
+        self._scrub_frame = None  # 拖动时最后显示的帧，松开后以彩色重绘
         
         # 添加样式表定义
         self.default_button_style = ""  # 默认样式
         self.marked_button_style = "background-color: #2196F3; color: white;"  # 标记后的样式
         
+        self.video_loaded.connect(self._on_video_loaded)
+        self.video_cut.connect(self._on_video_cut)
+        self.status_changed.connect(self._update_status)
+        
         # 设置窗口
         self.setWindowTitle("losslessClip无损剪辑v1.1")
         self.setMinimumSize(800, 600)
@@ -127,10 +261,26 @@ class MainWindow(QMainWindow):
         self.reset_btn.setFocusPolicy(Qt.NoFocus)
         self.export_btn.setFocusPolicy(Qt.NoFocus)
         
+        # 启动后台解码线程
+        self.decoder = FrameDecodeThread()
+        self.decoder.decode_stopped.connect(self._on_decode_stopped)
+        self.decoder.start()
+        
         # 设置定时器用于视频播放
+        # 使用高精度单次定时器，每帧显示完成后按下一帧的截止时间重新启动，保持稳定帧间隔
+        self.frame_interval = 66  # 1000ms/15fps ≈ 66ms
+        self._next_frame_deadline = 0.0  # 下一帧应显示的时刻（perf_counter秒）
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self._update_frame)
-        self.timer.start(66)  # 1000ms/15fps ≈ 66ms
+        
+        # 拖动进度条时合并跳转请求，每个间隔最多解码一次（加载视频时按分辨率调整）
+        self._pending_seek_frame = None
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(33)
+        self._seek_timer.timeout.connect(self._do_seek)
         
     def _create_ui(self):
         """创建用户界面"""
@@ -139,7 +289,7 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         
         # 视频显示区域
-        self.video_label = QLabel()
+        self.video_label = VideoLabel()
         self.video_label.setAlignment(Qt.AlignCenter)
         self.video_label.setStyleSheet("""
             QLabel {
@@ -148,8 +298,6 @@ class MainWindow(QMainWindow):
                 min-height: 480px;
             }
         """)
-        # 设置缩放策略
-        self.video_label.setScaledContents(True)
         layout.addWidget(self.video_label, stretch=1)
         
         # 时间显示和输入
@@ -208,11 +356,10 @@ class MainWindow(QMainWindow):
         
     def _format_time(self, seconds: float) -> str:
         """将秒数格式化为时间字符串"""
-        td = timedelta(seconds=seconds)
-        hours = td.seconds // 3600
-        minutes = (td.seconds % 3600) // 60
-        seconds = td.seconds % 60
-        milliseconds = td.microseconds // 1000
+        total_ms = round(seconds * 1000000) // 1000
+        total_seconds, milliseconds = divmod(total_ms, 1000)
+        minutes, seconds = divmod(total_seconds, 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
         
     def _parse_time(self, time_str: str) -> float:
@@ -233,66 +380,106 @@ class MainWindow(QMainWindow):
             pass
         return 0.0
         
+    def _decode_to(self, target_frame: int):
+        """解码到指定帧并返回 (ret, frame)
+        
+        目标帧在当前位置之后不远时，用 grab() 跳过中间帧（只解码，不做颜色转换和拷贝），
+        否则直接跳转；只对最终要显示的帧调用 retrieve()。后台已解码的旧帧会被丢弃。
+        """
+        target_frame = max(0, int(target_frame))
+        with self.decoder.cap_lock:
+            self.decoder.flush()
+            delta = target_frame - self.decoder.position
+            if 0 <= delta <= self.max_grab_frames:
+                for _ in range(delta):
+                    if not self.cap.grab():
+                        return False, None
+                    self.decoder.position += 1
+            else:
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
+                self.decoder.position = target_frame
+                
+            if not self.cap.grab():
+                return False, None
+            self.decoder.position += 1
+            ret, frame = self.cap.retrieve()
+            
+        if ret:
+            self._current_pos = target_frame + 1
+        return ret, frame
+        
+    def _prepare_image(self, frame: np.ndarray, grayscale: bool = False) -> Tuple[QImage, np.ndarray]:
+        """将解码帧缩放到预览分辨率，返回 (包装缩放结果的QImage, QImage底层数据)"""
+        # 使用预分配的缓存进行缩放（缩放到低分辨率），后台解码的帧已是预览尺寸
+        frame = resize_to_preview(frame, self.preview_width, self.preview_height, self._frame_buffer)
+            
+        # 灰度预览每像素只有1字节，绘制时搬运的数据量为彩色的1/3
+        if grayscale:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, self._gray_buffer)
+            return self._gray_image, self._gray_buffer
+            
+        if frame is self._frame_buffer:
+            return self._frame_image, self._frame_buffer
+            
+        # 解码帧已是预览尺寸时直接包装，无需拷贝
+        return self._wrap_image(frame, QImage.Format_BGR888), frame
+        
+    def _wrap_image(self, data: np.ndarray, image_format: QImage.Format) -> QImage:
+        """用QImage包装numpy数组（不拷贝数据，调用方需保持数组存活）"""
+        return QImage(
+            data.data,
+            data.shape[1],
+            data.shape[0],
+            data.strides[0],
+            image_format
+        )
+        
+    def _render_frame(self, frame: np.ndarray):
+        """将解码帧显示到视频区域，复用帧缓存，QImage直接绘制不经过QPixmap"""
+        grayscale = self._grayscale_preview and self.slider_pressed
+        image, data = self._prepare_image(frame, grayscale)
+        self.video_label.set_image(image, data)
+        
     def _update_frame(self):
         """更新视频帧"""
         if self.cap and self.is_playing:
             try:
-                ret, frame = self.cap.read()
-                if ret:
-                    # 初始化帧缓存（使用低分辨率）
-                    if self._frame_buffer is None:
-                        self._frame_buffer = np.empty((self.preview_height, self.preview_width, 3), dtype=np.uint8)
-                    
-                    # 使用预分配的缓存进行缩放（缩放到低分辨率）
-                    if frame.shape[:2] != (self.preview_height, self.preview_width):
-                        cv2.resize(
-                            frame, 
-                            (self.preview_width, self.preview_height),
-                            self._frame_buffer,
-                            interpolation=cv2.INTER_NEAREST
-                        )
-                        rgb_frame = cv2.cvtColor(self._frame_buffer, cv2.COLOR_BGR2RGB)
-                    else:
-                        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # 创建低分辨率QImage
-                    image = QImage(
-                        rgb_frame.data,
-                        self.preview_width,
-                        self.preview_height,
-                        rgb_frame.strides[0],
-                        QImage.Format_RGB888
-                    )
-                    
-                    # 创建高分辨率QPixmap
-                    if self._cached_pixmap is None:
-                        self._cached_pixmap = QPixmap.fromImage(image).scaled(
-                            self.display_width,
-                            self.display_height,
-                            Qt.KeepAspectRatio,
-                            Qt.SmoothTransformation  # 使用平滑缩放提高显示质量
-                        )
-                    else:
-                        self._cached_pixmap.convertFromImage(image)
-                        self._cached_pixmap = self._cached_pixmap.scaled(
-                            self.display_width,
-                            self.display_height,
-                            Qt.KeepAspectRatio,
-                            Qt.SmoothTransformation
-                        )
-                    
-                    self.video_label.setPixmap(self._cached_pixmap)
+                # 取出后台线程解码好的帧，解码未跟上时保持当前画面
+                item = self.decoder.take_frame()
+                if item is not None:
+                    self._current_pos, frame = item
+                    # 显示到视频区域（放大到显示尺寸在绘制时完成），画面不可见时跳过
+                    if not self.video_label.visibleRegion().isEmpty():
+                        self._render_frame(frame)
                     
                     # 减少进度更新频率
                     if not self.slider_pressed:
-                        current_time = self.cap.get(cv2.CAP_PROP_POS_FRAMES) / self.cap.get(cv2.CAP_PROP_FPS)
+                        current_time = self._frame_time(self._current_pos)
                         self._update_time_display(current_time)
-                else:
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
                     
             except Exception as e:
                 print(f"更新帧时发生错误: {str(e)}")
-            
+                
+            # 按截止时间安排下一帧，定时误差不会累积；落后超过一帧时从当前时刻重新计时，避免连续补帧
+            interval = self.frame_interval / 1000
+            now = time.perf_counter()
+            self._next_frame_deadline += interval
+            if self._next_frame_deadline < now:
+                self._next_frame_deadline = now + interval
+            self.timer.start(max(1, round((self._next_frame_deadline - now) * 1000)))
+            
+    def _start_playback_timer(self):
+        """从当前时刻开始按帧间隔安排播放"""
+        self._next_frame_deadline = time.perf_counter() + self.frame_interval / 1000
+        self.timer.start(self.frame_interval)
+        
+    def _frame_time(self, frame_pos: int) -> float:
+        """帧位置换算为时间（秒）
+        
+        用除法而不是乘以 1/fps：乘倒数有舍入误差（如 24fps 第 7 帧得到 6.999…），向下取整后会偏一帧。
+        """
+        return frame_pos / self._fps if self._fps > 0 else 0.0
+        
     def _update_time_display(self, current_time):
         """更新时间显示"""
         try:
@@ -303,6 +490,11 @@ class MainWindow(QMainWindow):
                 return
             
             progress = int(current_time * 1000 / self.video_processor.duration)
+            time_display = (int(current_time * 1000), progress)
+            if time_display == self._last_time_display:
+                return
+            self._last_time_display = time_display
+            
             self.progress_slider.setValue(progress)
             self.current_time_edit.setText(self._format_time(current_time))
             
@@ -316,75 +508,50 @@ class MainWindow(QMainWindow):
             time_pos = value * self.video_processor.duration / 1000
             self._update_time_display(time_pos)
             
-            # 立即更新画面
-            frame_pos = time_pos * self.cap.get(cv2.CAP_PROP_FPS)
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_pos)
-            # 强制更新一帧，即使在暂停状态
-            ret, frame = self.cap.read()
-            if ret:
-                # 使用更快的插值算法
-                frame = cv2.resize(
-                    frame, 
-                    (self.preview_width, self.preview_height),
-                    interpolation=cv2.INTER_NEAREST
-                )
-                
-                # 转换颜色空间
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # 创建QImage
-                image = QImage(
-                    rgb_frame.data,
-                    self.preview_width,
-                    self.preview_height,
-                    rgb_frame.strides[0],
-                    QImage.Format_RGB888
-                )
+            # 记录目标帧，由定时器合并后统一解码（即使在暂停状态也会更新画面）
+            self._pending_seek_frame = time_pos * self._fps
+            if not self._seek_timer.isActive():
+                self._seek_timer.start()
                 
-                self.video_label.setPixmap(QPixmap.fromImage(image))
+    def _do_seek(self):
+        """解码并显示拖动进度条时最新的目标帧"""
+        if not self.cap or self._pending_seek_frame is None:
+            return
+        frame_pos = self._pending_seek_frame
+        self._pending_seek_frame = None
+        ret, frame = self._decode_to(frame_pos)
+        if ret:
+            self._render_frame(frame)
+            if self._grayscale_preview and self.slider_pressed:
+                self._scrub_frame = frame
             
     def _on_slider_released(self):
         """进度条释放时的处理"""
         if self.cap:
             self.slider_pressed = False
-            value = self.progress_slider.value()
-            time_pos = value * self.video_processor.duration / 1000
-            frame_pos = time_pos * self.cap.get(cv2.CAP_PROP_FPS)
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_pos)
+            if self._seek_timer.isActive():
+                # 还有未执行的跳转，立即完成，解码位置随之停在目标帧之后
+                self._seek_timer.stop()
+                self._do_seek()
+            elif self._scrub_frame is not None:
+                # 灰度预览时，松开后以彩色重绘停留的画面
+                self._render_frame(self._scrub_frame)
+            self._scrub_frame = None
             
     def _on_time_input(self):
         """时间输入处理"""
         if self.cap:
             try:
                 time_pos = self._parse_time(self.current_time_edit.text())
-                frame_pos = time_pos * self.cap.get(cv2.CAP_PROP_FPS)
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_pos)
+                frame_pos = time_pos * self._fps
                 
                 # 读取并显示当前帧
-                ret, frame = self.cap.read()
+                ret, frame = self._decode_to(frame_pos)
                 if ret:
-                    # 调整大小
-                    frame = cv2.resize(
-                        frame, 
-                        (self.preview_width, self.preview_height),
-                        interpolation=cv2.INTER_NEAREST
-                    )
-                    
-                    # 转换颜色空间
-                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # 创建QImage
-                    image = QImage(
-                        rgb_frame.data,
-                        self.preview_width,
-                        self.preview_height,
-                        rgb_frame.strides[0],
-                        QImage.Format_RGB888
-                    )
-                    
-                    self.video_label.setPixmap(QPixmap.fromImage(image))
+                    self._render_frame(frame)
                 
-                # 更新时间显示和进度条
+                # 更新时间显示和进度条（强制刷新，规范化用户输入的文本）
+                self._last_time_display = None
                 self._update_time_display(time_pos)
                 
             except Exception as e:
@@ -394,44 +561,32 @@ class MainWindow(QMainWindow):
         """切换播放/暂停状态"""
         if self.cap:
             self.is_playing = not self.is_playing
+            self.decoder.set_active(self.is_playing)
+            if self.is_playing:
+                self._start_playback_timer()
             self.play_pause_btn.setText("暂停" if self.is_playing else "播放")
             
+    def _on_decode_stopped(self):
+        """后台解码停止时同步播放状态"""
+        self.is_playing = False
+        self.timer.stop()
+        self.play_pause_btn.setText("播放")
+            
     def _prev_frame(self):
         """跳转到上一帧"""
         if self.cap:
             try:
-                # 获取当前帧位置
-                current_frame = self.cap.get(cv2.CAP_PROP_POS_FRAMES)
+                # 获取当前显示帧位置
+                current_frame = self._current_pos
                 # 确保不会跳到负数帧
                 if current_frame > 1:
-                    # 跳转到上一帧
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, current_frame - 2)  # 减2是因为读取会自动前进一帧
-                    # 读取并显示帧
-                    ret, frame = self.cap.read()
+                    # 跳转到上一帧并读取显示（减2是因为读取会自动前进一帧）
+                    ret, frame = self._decode_to(current_frame - 2)
                     if ret:
-                        # 调整大小
-                        frame = cv2.resize(
-                            frame, 
-                            (self.preview_width, self.preview_height),
-                            interpolation=cv2.INTER_NEAREST
-                        )
-                        
-                        # 转换颜色空间
-                        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        
-                        # 创建QImage
-                        image = QImage(
-                            rgb_frame.data,
-                            self.preview_width,
-                            self.preview_height,
-                            rgb_frame.strides[0],
-                            QImage.Format_RGB888
-                        )
-                        
-                        self.video_label.setPixmap(QPixmap.fromImage(image))
+                        self._render_frame(frame)
                         
                         # 更新时间显示
-                        current_time = current_frame / self.cap.get(cv2.CAP_PROP_FPS)
+                        current_time = self._frame_time(current_frame)
                         self._update_time_display(current_time)
                         
             except Exception as e:
@@ -441,39 +596,31 @@ class MainWindow(QMainWindow):
         """跳转到下一帧"""
         if self.cap:
             try:
-                # 读取并显示下一帧
-                ret, frame = self.cap.read()
+                # 优先使用后台已解码的下一帧，没有时直接读取
+                item = self.decoder.take_frame()
+                if item is not None:
+                    ret = True
+                    current_frame, frame = item
+                else:
+                    with self.decoder.cap_lock:
+                        ret, frame = self.cap.read()
+                        if ret:
+                            self.decoder.position += 1
+                        current_frame = self.decoder.position
+                        
                 if ret:
-                    # 调整大小
-                    frame = cv2.resize(
-                        frame, 
-                        (self.preview_width, self.preview_height),
-                        interpolation=cv2.INTER_NEAREST
-                    )
-                    
-                    # 转换颜色空间
-                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # 创建QImage
-                    image = QImage(
-                        rgb_frame.data,
-                        self.preview_width,
-                        self.preview_height,
-                        rgb_frame.strides[0],
-                        QImage.Format_RGB888
-                    )
-                    
-                    self.video_label.setPixmap(QPixmap.fromImage(image))
+                    self._current_pos = current_frame
+                    self._render_frame(frame)
                     
                     # 更新时间显示
-                    current_frame = self.cap.get(cv2.CAP_PROP_POS_FRAMES)
-                    current_time = current_frame / self.cap.get(cv2.CAP_PROP_FPS)
+                    current_time = self._frame_time(current_frame)
                     self._update_time_display(current_time)
                     
                 else:
                     # 如果到达视频末尾，回到最后一帧
-                    total_frames = self.cap.get(cv2.CAP_PROP_FRAME_COUNT)
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, total_frames - 1)
+                    with self.decoder.cap_lock:
+                        self.cap.set(cv2.CAP_PROP_POS_FRAMES, self._total_frames - 1)
+                        self.decoder.position = max(0, self._total_frames - 1)
                     
             except Exception as e:
                 print(f"跳转到下一帧时发生错误: {str(e)}")
@@ -482,9 +629,9 @@ class MainWindow(QMainWindow):
         """标记开始时间点"""
         if self.cap:
             try:
-                current_time = self.cap.get(cv2.CAP_PROP_POS_FRAMES) / self.cap.get(cv2.CAP_PROP_FPS)
+                current_time = self._frame_time(self._current_pos)
                 # 开始时间向前对齐
-                self.start_time = self.video_processor.find_nearest_frame(self.cap, current_time, 'prev')
+                self.start_time = self.video_processor.find_nearest_frame(current_time, 'prev', self._fps)
                 
                 # 设置按钮样式
                 self.mark_start_btn.setStyleSheet(self.marked_button_style)
@@ -503,9 +650,9 @@ class MainWindow(QMainWindow):
         """标记结束时间点"""
         if self.cap:
             try:
-                current_time = self.cap.get(cv2.CAP_PROP_POS_FRAMES) / self.cap.get(cv2.CAP_PROP_FPS)
+                current_time = self._frame_time(self._current_pos)
                 # 结束时间向后对齐
-                self.end_time = self.video_processor.find_nearest_frame(self.cap, current_time, 'next')
+                self.end_time = self.video_processor.find_nearest_frame(current_time, 'next', self._fps)
                 
                 # 设置按钮样式
                 self.mark_end_btn.setStyleSheet(self.marked_button_style)
@@ -550,35 +697,38 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.No:
                 return
                 
-        # 禁用界面操作
-        self.setEnabled(False)
+        # 只禁用导出按钮，导出期间界面保持可用
+        self.export_btn.setEnabled(False)
         
-        # 创建并启动剪辑线程
+        # 源文件和时间点在界面线程取好，导出期间重新加载视频也不影响本次剪辑
+        source_file = self.video_processor.current_file
         output_path = self.video_processor.generate_output_filename()
-        self.cut_thread = VideoCutThread(
-            self.video_processor,
-            self.start_time,
-            self.end_time,
-            output_path
-        )
-        self.cut_thread.finished.connect(self._on_video_cut)
-        self.cut_thread.progress.connect(self._update_status)
-        self.cut_thread.start()
+        self._exported_marks = (self.start_time, self.end_time)
+        self._executor.submit(self._cut_video_task, source_file, self.start_time, self.end_time, output_path)
+        
+    def _cut_video_task(self, source_file: str, start_time: float, end_time: float, output_path: str):
+        """后台剪辑任务"""
+        try:
+            self.status_changed.emit("正在导出视频...")
+            success = self.video_processor.cut_video(start_time, end_time, output_path, source_file)
+        except Exception as e:
+            print(f"视频剪辑线程错误: {str(e)}")
+            success = False
+        self.video_cut.emit(success, output_path)
         
     def _on_video_cut(self, success: bool, output_path: str):
         """视频剪辑完成的回调"""
-        self.setEnabled(True)
+        self.export_btn.setEnabled(True)
         if success:
-            # 重置按钮样式
-            self.mark_start_btn.setStyleSheet(self.default_button_style)
-            self.mark_end_btn.setStyleSheet(self.default_button_style)
+            # 只有时间点仍是本次导出的那一组时才重置按钮样式，导出期间新设的标记保持高亮
+            if self._exported_marks == (self.start_time, self.end_time):
+                self.mark_start_btn.setStyleSheet(self.default_button_style)
+                self.mark_end_btn.setStyleSheet(self.default_button_style)
             
-            QMessageBox.information(
-                self,
-                "导出成功",
-                f"已导出：{output_path}"
-            )
+            # 在状态栏提示，不弹出模态对话框
+            self.statusBar().showMessage(f"已导出：{output_path}", 5000)
         else:
+            self.statusBar().clearMessage()
             QMessageBox.warning(
                 self,
                 "导出失败",
@@ -599,11 +749,8 @@ class MainWindow(QMainWindow):
             # 禁用界面操作
             self.setEnabled(False)
             
-            # 创建并启动加载线程
-            self.load_thread = VideoLoadThread(self.video_processor, file_path)
-            self.load_thread.finished.connect(self._on_video_loaded)
-            self.load_thread.progress.connect(self._update_status)
-            self.load_thread.start()
+            # 在后台线程中加载
+            self._executor.submit(self._load_video_task, file_path)
             
         except Exception as e:
             print(f"加载视频时发生错误: {str(e)}")
@@ -611,6 +758,16 @@ class MainWindow(QMainWindow):
             self.setEnabled(True)
             return False
             
+    def _load_video_task(self, file_path: str):
+        """后台加载任务"""
+        try:
+            self.status_changed.emit("正在加载视频信息...")
+            success = self.video_processor.load_video(file_path)
+        except Exception as e:
+            print(f"加载视频线程错误: {str(e)}")
+            success = False
+        self.video_loaded.emit(success)
+            
     def _on_video_loaded(self, success: bool):
         """视频加载完成的回调"""
         self.setEnabled(True)
@@ -619,13 +776,8 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            # 初始化视频播放
-            if self.cap is not None:
-                self.cap.release()
-            
-            # 设置OpenCV的缓冲区大小
-            self.cap = cv2.VideoCapture(self.video_processor.current_file)
-            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 3)  # 减少缓冲区大小
+            # 初始化视频播放（先让后台线程停止使用旧视频）
+            self.decoder.set_capture(None)
             
             # 对于4K视频，进一步降低预览分辨率
             if self.video_processor.width >= 3840:  # 4K
@@ -638,10 +790,39 @@ class MainWindow(QMainWindow):
                 self.preview_width = 854   # 480p
                 self.preview_height = 480
             
+            # 打开视频（FFmpeg 后端 + 硬件解码）
+            self._init_video_player(self.video_processor.current_file)
+            self._current_pos = 0
+            
+            # 按预览分辨率预分配帧缓存，所有显示路径共用
+            self._frame_buffer = np.empty((self.preview_height, self.preview_width, 3), dtype=np.uint8)
+            
+            # 拖动进度条时的解码间隔：4K解码较慢用33ms，其余16ms（约每次屏幕刷新解码一次）
+            self._seek_timer.setInterval(33 if self.video_processor.width >= 3840 else 16)
+            
+            # 4K视频拖动进度条时只用灰度预览，减少数据搬运
+            self._grayscale_preview = self.video_processor.width >= 3840
+            self._gray_buffer = (
+                np.empty((self.preview_height, self.preview_width), dtype=np.uint8)
+                if self._grayscale_preview else None
+            )
+            self._scrub_frame = None
+            
+            # 直接使用OpenCV的BGR数据，无需转换颜色空间
+            self._frame_image = self._wrap_image(self._frame_buffer, QImage.Format_BGR888)
+            self._gray_image = (
+                self._wrap_image(self._gray_buffer, QImage.Format_Grayscale8)
+                if self._grayscale_preview else None
+            )
+            
             if not self.cap.isOpened():
                 QMessageBox.warning(self, "错误", "无法打开视频文件")
                 return
             
+            # 缓存帧率和总帧数
+            self._fps = self.cap.get(cv2.CAP_PROP_FPS)
+            self._total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            
             # 更新UI
             self.duration_label.setText(
                 f"/ {self._format_time(self.video_processor.duration)}"
@@ -649,9 +830,13 @@ class MainWindow(QMainWindow):
             self.progress_slider.setRange(0, 1000)
             self.start_time = 0.0
             self.end_time = self.video_processor.duration
+            self._last_time_display = None
             self._update_time_display(0.0)
             self.is_playing = True
             self.play_pause_btn.setText("暂停")
+            self.decoder.set_capture(self.cap, (self.preview_width, self.preview_height))
+            self.decoder.set_active(True)
+            self._start_playback_timer()
             
         except Exception as e:
             print(f"初始化视频播放失败: {str(e)}")
@@ -681,8 +866,22 @@ class MainWindow(QMainWindow):
         if file_path:
             self.load_video(file_path)
             
+    def changeEvent(self, event):
+        """窗口状态变化事件处理，最小化时暂停解码和播放定时器"""
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.timer.stop()
+                self.decoder.set_active(False)
+            elif self.cap and self.is_playing:
+                self.decoder.set_active(True)
+                self._start_playback_timer()
+        super().changeEvent(event)
+        
     def closeEvent(self, event):
         """窗口关闭事件处理"""
+        self.timer.stop()
+        self.decoder.stop()
+        self._executor.shutdown(wait=False)
         if self.cap is not None:
             self.cap.release()
         event.accept()
@@ -697,47 +896,17 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            # 获取当前时间位置
-            current_frame = self.cap.get(cv2.CAP_PROP_POS_FRAMES)
-            fps = self.cap.get(cv2.CAP_PROP_FPS)
-            current_time = current_frame / fps
+            # 按帧数计算目标位置，避免帧号和时间来回换算的舍入误差
+            target_frame = self._current_pos + round(time_offset * self._fps)
             
-            # 计算目标时间
-            target_time = current_time + time_offset
+            # 确保帧位置在有效范围内
+            target_frame = max(0, min(target_frame, self._total_frames))
+            target_time = min(self._frame_time(target_frame), self.video_processor.duration)
             
-            # 确保时间在有效范围内
-            if target_time < 0:
-                target_time = 0
-            if target_time > self.video_processor.duration:
-                target_time = self.video_processor.duration
-            
-            # 计算目标帧位置
-            target_frame = int(target_time * fps)
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-            
-            # 读取并显示当前帧
-            ret, frame = self.cap.read()
+            # 解码并显示目标帧（小幅向后跳转时逐帧grab，避免重新定位关键帧）
+            ret, frame = self._decode_to(target_frame)
             if ret:
-                # 使用最快的插值算法
-                frame = cv2.resize(
-                    frame, 
-                    (self.preview_width, self.preview_height),
-                    interpolation=cv2.INTER_NEAREST
-                )
-                
-                # 使用更快的颜色空间转换
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # 避免数据复制
-                image = QImage(
-                    rgb_frame.data,
-                    self.preview_width,
-                    self.preview_height,
-                    rgb_frame.strides[0],
-                    QImage.Format_RGB888
-                )
-                
-                self.video_label.setPixmap(QPixmap.fromImage(image))
+                self._render_frame(frame)
                 self._update_time_display(target_time)
             
         except Exception as e:
@@ -776,408 +945,36 @@ class MainWindow(QMainWindow):
     def _init_video_player(self, file_path: str):
         """初始化视频播放器"""
         try:
-            # 尝试使用 AMD 硬件加速
-            # 首先尝试 AMD AMF 编解码器
-            self.cap = cv2.VideoCapture(file_path, cv2.CAP_MSMF)  # Microsoft Media Foundation 支持 AMD 加速
+            # 复用同一个 VideoCapture，open() 会先释放之前打开的视频
+            if not isinstance(self.cap, cv2.VideoCapture):
+                # 上一个视频使用的是 FFmpeg 子进程读取器
+                if self.cap is not None:
+                    self.cap.release()
+                self.cap = cv2.VideoCapture()
+                
+            # 使用 FFmpeg 后端，并在打开时请求硬件解码（D3D11VA/DXVA2/NVDEC 等，打开后再设置无效）
+            self.cap.open(
+                file_path,
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            )
             
             if not self.cap.isOpened():
-                # 如果不支持硬件加速，回退到普通模式
-                self.cap = cv2.VideoCapture(file_path)
-                print("硬件加速不可用，使用软件解码")
-            else:
+                # FFmpeg 后端无法打开时，回退到默认后端
+                self.cap.open(file_path)
+                print("FFmpeg 后端不可用，使用默认后端解码")
+            elif self.cap.get(cv2.CAP_PROP_HW_ACCELERATION) != cv2.VIDEO_ACCELERATION_NONE:
                 print("使用硬件加速解码")
+            else:
+                print("硬件加速不可用，使用软件解码")
+                
+            if not self.cap.isOpened():
+                # OpenCV 无法打开时，用自带的 FFmpeg 解码，直接输出预览尺寸的帧
+                self.cap = self.video_processor.open_raw_reader(self.preview_width, self.preview_height)
+                print("OpenCV 无法打开视频，使用 FFmpeg 子进程解码")
             
             # 优化解码参数
             self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # 最小缓冲区
             
-            # 尝试启用所有可用的硬件加速
-            self.cap.set(cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY)
-            
-            # 设置解码参数
-            self.cap.set(cv2.CAP_PROP_FORMAT, -1)  # 使用原生格式
-            
-            # 直接解码为较低分辨率
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.preview_width)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.preview_height)
-            
-            # 优先使用 H.264/HEVC 解码器
-            codecs = [
-                cv2.VideoWriter_fourcc('H', 'E', 'V', 'C'),  # HEVC/H.265
-                cv2.VideoWriter_fourcc('H', '2', '6', '4'),  # H.264
-                cv2.VideoWriter_fourcc('a', 'v', 'c', '1'),  # AVC
-            ]
-            
-            # 尝试设置不同的解码器
-            for codec in codecs:
-                if self.cap.set(cv2.CAP_PROP_FOURCC, codec):
-                    print(f"使用解码器: {chr(codec & 0xFF)}{chr((codec >> 8) & 0xFF)}"
-                          f"{chr((codec >> 16) & 0xFF)}{chr((codec >> 24) & 0xFF)}")
-                    break
-            
-            # 设置线程数为CPU核心数的一半
-            import multiprocessing
-            n_cores = max(1, multiprocessing.cpu_count() // 2)
-            self.cap.set(cv2.CAP_PROP_THREAD_COUNT, n_cores)
-            
-            # 创建帧缓存
-            self._frame_buffer = None
-            self._cached_pixmap = None
-            
         except Exception as e:
-            print(f"初始化视频播放器失败: {str(e)}")
-        
-    def _update_frame(self):
-        """更新视频帧"""
-        if self.cap and self.is_playing:
-            try:
-                ret, frame = self.cap.read()
-                if ret:
-                    # 初始化帧缓存（使用低分辨率）
-                    if self._frame_buffer is None:
-                        self._frame_buffer = np.empty((self.preview_height, self.preview_width, 3), dtype=np.uint8)
-                    
-                    # 使用预分配的缓存进行缩放（缩放到低分辨率）
-                    if frame.shape[:2] != (self.preview_height, self.preview_width):
-                        cv2.resize(
-                            frame, 
-                            (self.preview_width, self.preview_height),
-                            self._frame_buffer,
-                            interpolation=cv2.INTER_NEAREST
-                        )
-                        rgb_frame = cv2.cvtColor(self._frame_buffer, cv2.COLOR_BGR2RGB)
-                    else:
-                        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # 创建低分辨率QImage
-                    image = QImage(
-                        rgb_frame.data,
-                        self.preview_width,
-                        self.preview_height,
-                        rgb_frame.strides[0],
-                        QImage.Format_RGB888
-                    )
-                    
-                    # 创建高分辨率QPixmap
-                    if self._cached_pixmap is None:
-                        self._cached_pixmap = QPixmap.fromImage(image).scaled(
-                            self.display_width,
-                            self.display_height,
-                            Qt.KeepAspectRatio,
-                            Qt.SmoothTransformation  # 使用平滑缩放提高显示质量
-                        )
-                    else:
-                        self._cached_pixmap.convertFromImage(image)
-                        self._cached_pixmap = self._cached_pixmap.scaled(
-                            self.display_width,
-                            self.display_height,
-                            Qt.KeepAspectRatio,
-                            Qt.SmoothTransformation
-                        )
-                    
-                    self.video_label.setPixmap(self._cached_pixmap)
-                    
-                    # 减少进度更新频率
-                    if not self.slider_pressed:
-                        current_time = self.cap.get(cv2.CAP_PROP_POS_FRAMES) / self.cap.get(cv2.CAP_PROP_FPS)
-                        self._update_time_display(current_time)
-                else:
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                    
-            except Exception as e:
-                print(f"更新帧时发生错误: {str(e)}")
-            
-    def _update_time_display(self, current_time):
-        """更新时间显示"""
-        try:
-            if not hasattr(self, 'video_processor') or not self.video_processor:
-                return
-            
-            if self.video_processor.duration <= 0:
-                return
-            
-            progress = int(current_time * 1000 / self.video_processor.duration)
-            self.progress_slider.setValue(progress)
-            self.current_time_edit.setText(self._format_time(current_time))
-            
-        except Exception as e:
-            print(f"更新时间显示时发生错误: {str(e)}")
-            
-    def _on_slider_moved(self, value: int):
-        """进度条拖动时的处理"""
-        if self.cap:
-            self.slider_pressed = True
-            time_pos = value * self.video_processor.duration / 1000
-            self._update_time_display(time_pos)
-            
-            # 立即更新画面
-            frame_pos = time_pos * self.cap.get(cv2.CAP_PROP_FPS)
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_pos)
-            # 强制更新一帧，即使在暂停状态
-            ret, frame = self.cap.read()
-            if ret:
-                # 使用更快的插值算法
-                frame = cv2.resize(
-                    frame, 
-                    (self.preview_width, self.preview_height),
-                    interpolation=cv2.INTER_NEAREST
-                )
-                
-                # 转换颜色空间
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # 创建QImage
-                image = QImage(
-                    rgb_frame.data,
-                    self.preview_width,
-                    self.preview_height,
-                    rgb_frame.strides[0],
-                    QImage.Format_RGB888
-                )
-                
-                self.video_label.setPixmap(QPixmap.fromImage(image))
-            
-    def _on_slider_released(self):
-        """进度条释放时的处理"""
-        if self.cap:
-            self.slider_pressed = False
-            value = self.progress_slider.value()
-            time_pos = value * self.video_processor.duration / 1000
-            frame_pos = time_pos * self.cap.get(cv2.CAP_PROP_FPS)
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_pos)
-            
-    def _on_time_input(self):
-        """时间输入处理"""
-        if self.cap:
-            try:
-                time_pos = self._parse_time(self.current_time_edit.text())
-                frame_pos = time_pos * self.cap.get(cv2.CAP_PROP_FPS)
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_pos)
-                
-                # 读取并显示当前帧
-                ret, frame = self.cap.read()
-                if ret:
-                    # 调整大小
-                    frame = cv2.resize(
-                        frame, 
-                        (self.preview_width, self.preview_height),
-                        interpolation=cv2.INTER_NEAREST
-                    )
-                    
-                    # 转换颜色空间
-                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # 创建QImage
-                    image = QImage(
-                        rgb_frame.data,
-                        self.preview_width,
-                        self.preview_height,
-                        rgb_frame.strides[0],
-                        QImage.Format_RGB888
-                    )
-                    
-                    self.video_label.setPixmap(QPixmap.fromImage(image))
-                
-                # 更新时间显示和进度条
-                self._update_time_display(time_pos)
-                
-            except Exception as e:
-                print(f"时间输入处理错误: {str(e)}")
-            
-    def _toggle_play(self):
-        """切换播放/暂停状态"""
-        if self.cap:
-            self.is_playing = not self.is_playing
-            self.play_pause_btn.setText("暂停" if self.is_playing else "播放")
-            
-    def _prev_frame(self):
-        """跳转到上一帧"""
-        if self.cap:
-            try:
-                # 获取当前帧位置
-                current_frame = self.cap.get(cv2.CAP_PROP_POS_FRAMES)
-                # 确保不会跳到负数帧
-                if current_frame > 1:
-                    # 跳转到上一帧
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, current_frame - 2)  # 减2是因为读取会自动前进一帧
-                    # 读取并显示帧
-                    ret, frame = self.cap.read()
-                    if ret:
-                        # 调整大小
-                        frame = cv2.resize(
-                            frame, 
-                            (self.preview_width, self.preview_height),
-                            interpolation=cv2.INTER_NEAREST
-                        )
-                        
-                        # 转换颜色空间
-                        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        
-                        # 创建QImage
-                        image = QImage(
-                            rgb_frame.data,
-                            self.preview_width,
-                            self.preview_height,
-                            rgb_frame.strides[0],
-                            QImage.Format_RGB888
-                        )
-                        
-                        self.video_label.setPixmap(QPixmap.fromImage(image))
-                        
-                        # 更新时间显示
-                        current_time = current_frame / self.cap.get(cv2.CAP_PROP_FPS)
-                        self._update_time_display(current_time)
-                        
-            except Exception as e:
-                print(f"跳转到上一帧时发生错误: {str(e)}")
-
-    def _next_frame(self):
-        """跳转到下一帧"""
-        if self.cap:
-            try:
-                # 读取并显示下一帧
-                ret, frame = self.cap.read()
-                if ret:
-                    # 调整大小
-                    frame = cv2.resize(
-                        frame, 
-                        (self.preview_width, self.preview_height),
-                        interpolation=cv2.INTER_NEAREST
-                    )
-                    
-                    # 转换颜色空间
-                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # 创建QImage
-                    image = QImage(
-                        rgb_frame.data,
-                        self.preview_width,
-                        self.preview_height,
-                        rgb_frame.strides[0],
-                        QImage.Format_RGB888
-                    )
-                    
-                    self.video_label.setPixmap(QPixmap.fromImage(image))
-                    
-                    # 更新时间显示
-                    current_frame = self.cap.get(cv2.CAP_PROP_POS_FRAMES)
-                    current_time = current_frame / self.cap.get(cv2.CAP_PROP_FPS)
-                    self._update_time_display(current_time)
-                    
-                else:
-                    # 如果到达视频末尾，回到最后一帧
-                    total_frames = self.cap.get(cv2.CAP_PROP_FRAME_COUNT)
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, total_frames - 1)
-                    
-            except Exception as e:
-                print(f"跳转到下一帧时发生错误: {str(e)}")
-            
-    def _mark_start(self):
-        """标记开始时间点"""
-        if self.cap:
-            try:
-                current_time = self.cap.get(cv2.CAP_PROP_POS_FRAMES) / self.cap.get(cv2.CAP_PROP_FPS)
-                # 开始时间向前对齐
-                self.start_time = self.video_processor.find_nearest_frame(self.cap, current_time, 'prev')
-                
-                # 设置按钮样式
-                self.mark_start_btn.setStyleSheet(self.marked_button_style)
-                
-                QMessageBox.information(
-                    self,
-                    "标记起点",
-                    f"原始时间点：{self._format_time(current_time)}\n"
-                    f"对齐后时间点：{self._format_time(self.start_time)}"
-                )
-                
-            except Exception as e:
-                print(f"标记起点时发生错误: {str(e)}")
-
-    def _mark_end(self):
-        """标记结束时间点"""
-        if self.cap:
-            try:
-                current_time = self.cap.get(cv2.CAP_PROP_POS_FRAMES) / self.cap.get(cv2.CAP_PROP_FPS)
-                # 结束时间向后对齐
-                self.end_time = self.video_processor.find_nearest_frame(self.cap, current_time, 'next')
-                
-                # 设置按钮样式
-                self.mark_end_btn.setStyleSheet(self.marked_button_style)
-                
-                QMessageBox.information(
-                    self,
-                    "标记终点",
-                    f"原始时间点：{self._format_time(current_time)}\n"
-                    f"对齐后时间点：{self._format_time(self.end_time)}"
-                )
-                
-            except Exception as e:
-                print(f"标记终点时发生错误: {str(e)}")
-            
-    def _reset_marks(self):
-        """重置开始和结束时间标记"""
-        try:
-            self.start_time = 0.0
-            self.end_time = self.video_processor.duration if self.video_processor else 0.0
-            
-            # 重置按钮样式
-            self.mark_start_btn.setStyleSheet(self.default_button_style)
-            self.mark_end_btn.setStyleSheet(self.default_button_style)
-            
-            self._update_time_display(0.0)  # 更新时间显示
-            
-        except Exception as e:
-            print(f"重置标记时发生错误: {str(e)}")
-        
-    def _export_video(self):
-        """导出视频片段"""
-        if not self.cap:
-            return
-            
-        if self.start_time == 0.0 and self.end_time == self.video_processor.duration:
-            reply = QMessageBox.question(
-                self,
-                "确认导出",
-                "您未手动设置时间点，是否继续导出？",
-                QMessageBox.Yes | QMessageBox.No
-            )
-            if reply == QMessageBox.No:
-                return
-                
-        # 禁用界面操作
-        self.setEnabled(False)
-        
-        # 创建并启动剪辑线程
-        output_path = self.video_processor.generate_output_filename()
-        self.cut_thread = VideoCutThread(
-            self.video_processor,
-            self.start_time,
-            self.end_time,
-            output_path
-        )
-        self.cut_thread.finished.connect(self._on_video_cut)
-        self.cut_thread.progress.connect(self._update_status)
-        self.cut_thread.start()
-        
-    def _on_video_cut(self, success: bool, output_path: str):
-        """视频剪辑完成的回调"""
-        self.setEnabled(True)
-        if success:
-            # 重置按钮样式
-            self.mark_start_btn.setStyleSheet(self.default_button_style)
-            self.mark_end_btn.setStyleSheet(self.default_button_style)
-            
-            QMessageBox.information(
-                self,
-                "导出成功",
-                f"已导出：{output_path}"
-            )
-        else:
-            QMessageBox.warning(
-                self,
-                "导出失败",
-                "视频导出失败，请检查日志"
-            )
-        
-    def _update_status(self, message: str):
-        """更新状态信息"""
-        self.statusBar().showMessage(message) 
\ No newline at end of file
+            print(f"初始化视频播放器失败: {str(e)}")
\ No newline at end of file
@@ -4,8 +4,9 @@ import subprocess
 import sys
 import json
 from pathlib import Path
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Union
 import cv2
+import numpy as np
 
 class VideoProcessor:
     """视频处理核心类，负责视频信息获取和剪辑操作"""
@@ -30,6 +31,7 @@ class VideoProcessor:
         self.startupinfo.wShowWindow = subprocess.SW_HIDE
         self.current_file = None
         self.duration = 0.0
+        self.fps = 0.0
 
     def load_video(self, file_path: str) -> bool:
         """加载视频文件并获取基本信息"""
@@ -39,12 +41,12 @@ class VideoProcessor:
                 print(f"文件不存在: {file_path}")
                 return False
             
-            # 获取视频基本信息
+            # 一次调用同时获取视频流信息和容器时长
             cmd = [
                 self.ffprobe_path,
                 "-v", "error",
                 "-select_streams", "v:0",
-                "-show_entries", "stream=width,height,duration",
+                "-show_entries", "stream=width,height,avg_frame_rate:format=duration",
                 "-of", "json",
                 file_path
             ]
@@ -69,65 +71,78 @@ class VideoProcessor:
             self.height = int(stream.get('height', 0))
             self.current_file = file_path
             
+            # 解析平均帧率（形如 "30000/1001"）
+            num, _, den = stream.get('avg_frame_rate', '0/0').partition('/')
+            den = float(den or 1)
+            self.fps = float(num) / den if den else 0.0
+            
             # 获取视频时长
-            cmd = [
-                self.ffprobe_path,
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                file_path
-            ]
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True,
-                startupinfo=self.startupinfo
-            )
-            if result.returncode != 0:
-                print(f"获取视频时长失败: {result.stderr}")
+            duration = info.get('format', {}).get('duration')
+            if duration is None:
+                print(f"获取视频时长失败: {file_path}")
                 return False
                 
-            self.duration = float(result.stdout.strip())
+            self.duration = float(duration)
             return True
             
         except Exception as e:
             print(f"加载视频失败: {str(e)}")
             return False
 
-    def find_nearest_frame(self, cap: cv2.VideoCapture, current_time: float, align_mode: str = 'prev') -> float:
+    def open_raw_reader(self, width: int, height: int) -> 'FFmpegRawReader':
+        """
+        用 FFmpeg 子进程打开当前视频
+        
+        Args:
+            width: 输出帧宽度
+            height: 输出帧高度
+            
+        Returns:
+            FFmpegRawReader: 接口与 cv2.VideoCapture 一致的读取器
+        """
+        return FFmpegRawReader(
+            self.ffmpeg_path,
+            self.current_file,
+            width,
+            height,
+            self.fps,
+            int(round(self.duration * self.fps)),
+            self.startupinfo
+        )
+
+    def find_nearest_frame(self, current_time: Union[float, np.ndarray], align_mode: str = 'prev',
+                           fps: Optional[float] = None) -> Union[float, np.ndarray]:
         """
         计算最近的帧时间点
         
         Args:
-            cap: OpenCV视频捕获对象
-            current_time: 当前时间点（秒）
+            current_time: 当前时间点（秒），也可以是时间点数组
             align_mode: 对齐模式，'prev' 向前对齐，'next' 向后对齐
+            fps: 帧率，为空或 0 时使用加载视频时获取的帧率
             
         Returns:
-            float: 对齐后的时间点
+            float | np.ndarray: 对齐后的时间点，传入数组时返回数组
         """
-        fps = cap.get(cv2.CAP_PROP_FPS)
+        if not fps:
+            fps = self.fps
+        if not fps:
+            # 帧率未知时无法对齐，原样返回
+            return current_time
         frame_duration = 1.0 / fps  # 每帧的持续时间
         
-        # 计算当前帧号
-        current_frame = int(current_time * fps)
+        # 计算当前帧号，加一个小量避免 6.999… 这类浮点误差被向下取整成前一帧
+        current_frame = np.floor(np.asarray(current_time, dtype=np.float64) * fps + 1e-6)
         
-        if align_mode == 'prev':
-            # 向前对齐（用于开始时间点）
-            aligned_time = current_frame * frame_duration
-        else:
+        if align_mode != 'prev':
             # 向后对齐（用于结束时间点）
-            aligned_time = (current_frame + 1) * frame_duration
+            current_frame += 1
         
         # 确保不会超出视频范围
-        if aligned_time < 0:
-            aligned_time = 0
-        if aligned_time > self.duration:
-            aligned_time = self.duration
-            
-        return aligned_time
+        aligned_time = np.clip(current_frame * frame_duration, 0, self.duration)
+        return float(aligned_time) if aligned_time.ndim == 0 else aligned_time
 
-    def cut_video(self, start_time: float, end_time: float, output_path: str) -> bool:
+    def cut_video(self, start_time: float, end_time: float, output_path: str,
+                  source_file: Optional[str] = None) -> bool:
         """
         执行视频剪辑
         
@@ -135,20 +150,23 @@ class VideoProcessor:
             start_time: 起始时间（秒）
             end_time: 结束时间（秒）
             output_path: 输出文件路径
+            source_file: 源视频路径，默认使用当前加载的文件
             
         Returns:
             bool: 是否成功剪辑
         """
-        if not self.current_file:
+        source_file = source_file or self.current_file
+        if not source_file:
             return False
             
         try:
             cmd = [
                 self.ffmpeg_path,
                 "-ss", str(start_time),
-                "-i", self.current_file,
+                "-i", source_file,
                 "-t", str(end_time - start_time),
                 "-c", "copy",
+                "-avoid_negative_ts", "make_zero",  # 时间戳从0开始，避免关键帧前的负时间戳
                 "-y",  # 覆盖已存在的文件
                 output_path
             ]
@@ -179,13 +197,130 @@ class VideoProcessor:
         base_name = source_path.stem
         target_dir = source_path.parent
         prefix = f"{base_name}_cut_"
-        pattern = re.compile(rf"^{prefix}(\d+)\.mp4$")
+        pattern = re.compile(rf"^{re.escape(prefix)}(\d+)\.mp4$")
         
         max_num = 0
-        for file in os.listdir(target_dir):
-            match = pattern.match(file)
-            if match:
-                current_num = int(match.group(1))
-                max_num = max(max_num, current_num)
+        with os.scandir(target_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                # 先用字符串前后缀过滤，只对可能匹配的文件名做正则匹配
+                if not (name.startswith(prefix) and name.endswith(".mp4")):
+                    continue
+                match = pattern.match(name)
+                if match:
+                    current_num = int(match.group(1))
+                    max_num = max(max_num, current_num)
                 
-        return str(target_dir / f"{prefix}{max_num + 1}.mp4") 
\ No newline at end of file
+        return str(target_dir / f"{prefix}{max_num + 1}.mp4") 
+
+class FFmpegRawReader:
+    """
+    通过 FFmpeg 子进程读取 rawvideo 帧
+    
+    提供与 cv2.VideoCapture 相同的 grab/retrieve/read/set/get/release 接口，
+    在 OpenCV 无法打开视频时作为后备。帧由 FFmpeg 缩放到指定尺寸，
+    从管道直接读入 numpy 数组，跳转时以 -ss 重新启动子进程。
+    """
+    
+    def __init__(self, ffmpeg_path: str, file_path: str, width: int, height: int,
+                 fps: float, frame_count: int, startupinfo=None):
+        self.ffmpeg_path = ffmpeg_path
+        self.file_path = file_path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.frame_count = frame_count
+        self.startupinfo = startupinfo
+        self._proc: Optional[subprocess.Popen] = None
+        self._frame: Optional[np.ndarray] = None
+        self._pos = 0
+        self._start_pos = 0  # 子进程启动时的帧位置
+        self._has_frames = False  # 打开文件后是否读到过帧
+        self._start(0)
+
+    def _start(self, frame_pos: int):
+        """从指定帧启动 FFmpeg 子进程"""
+        self.release()
+        cmd = [self.ffmpeg_path, "-v", "error", "-hwaccel", "auto"]
+        if frame_pos > 0:
+            cmd += ["-ss", f"{frame_pos / self.fps:.6f}"]
+        cmd += [
+            "-i", self.file_path,
+            "-an", "-sn",
+            "-vf", f"scale={self.width}:{self.height}",
+            "-f", "rawvideo",
+            "-pix_fmt", "bgr24",
+            "-"
+        ]
+        self._proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,  # 直接 readinto 到帧数组，不经过 Python 缓冲区
+            startupinfo=self.startupinfo
+        )
+        self._pos = frame_pos
+        self._start_pos = frame_pos
+
+    def isOpened(self) -> bool:
+        return self._proc is not None
+
+    def grab(self) -> bool:
+        """从管道读取下一帧"""
+        if self._proc is None:
+            return False
+        frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        buf = memoryview(frame.reshape(-1))
+        received = 0
+        while received < len(buf):
+            n = self._proc.stdout.readinto(buf[received:])
+            if not n:
+                # 视频结束或子进程退出
+                self._frame = None
+                if self._start_pos == 0 and not self._has_frames:
+                    # 从开头启动也一帧都没读到（无法解码、硬件加速初始化失败等），关闭读取器，避免反复重启子进程；
+                    # 跳转到结尾后读不到帧属于正常情况，返回 False 由调用方回到开头
+                    self.release()
+                return False
+            received += n
+        self._frame = frame
+        self._pos += 1
+        self._has_frames = True
+        return True
+
+    def retrieve(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        # 与 cv2.VideoCapture.retrieve 签名一致；每帧都是新数组，忽略 image
+        return self._frame is not None, self._frame
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def set(self, prop_id: int, value: float) -> bool:
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            self._start(max(0, int(value)))
+            return True
+        return False
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self.frame_count)
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._pos)
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.width)
+        if prop_id == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.height)
+        return 0.0
+
+    def release(self):
+        """结束 FFmpeg 子进程"""
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.stdout.close()
+            self._proc.wait()
+            self._proc = None
+        self._frame = None
\ No newline at end of file